@@ -2,16 +2,37 @@
 
 import os
 import shutil
+import sys
+import stat
 import subprocess
+import tempfile
 from pathlib import Path
 import datetime
+import dataclasses
 import hashlib
 import concurrent.futures
 import threading
+import itertools
+import multiprocessing
+import re
+import errno
+import mmap
+import logging
+import logging.handlers
+import queue
+import contextlib
+import functools
+
+try:
+    import posix
+except ImportError:
+    posix = None
 
 import inquirer
 import exiftool  # uses exiftool under the hood
+import xxhash
 from rich.console import Console
+from rich.logging import RichHandler
 from rich.progress import (
     Progress,
     TextColumn,
@@ -27,97 +48,223 @@ from rich.text import Text
 # Initialize rich console
 console = Console()
 
+# Messages from import worker threads go through this logger, see queued_logging()
+logger = logging.getLogger("phototool")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
 # Define global constants
+# Extension sets are lowercase; compare them against suffix.lower()
 # Main photo file extensions (RAW and common formats)
-PHOTO_EXTENSIONS = [
-    ".raf",  # Fujifilm RAW
-    ".cr2",
-    ".cr3",  # Canon RAW
-    ".nef",  # Nikon RAW
-    ".arw",  # Sony RAW
-    ".dng",  # Digital Negative (Adobe)
-    ".rw2",  # Panasonic RAW
-    ".orf",  # Olympus RAW
-    ".pef",  # Pentax RAW
-    ".srw",  # Samsung RAW
-    ".jpg",
-    ".jpeg",  # JPEG
-    ".heic",  # Apple HEIC
-    ".png",  # PNG
-    ".tif",
-    ".tiff",  # TIFF
-]
+PHOTO_EXTENSIONS = frozenset(
+    {
+        ".raf",  # Fujifilm RAW
+        ".cr2",
+        ".cr3",  # Canon RAW
+        ".nef",  # Nikon RAW
+        ".arw",  # Sony RAW
+        ".dng",  # Digital Negative (Adobe)
+        ".rw2",  # Panasonic RAW
+        ".orf",  # Olympus RAW
+        ".pef",  # Pentax RAW
+        ".srw",  # Samsung RAW
+        ".jpg",
+        ".jpeg",  # JPEG
+        ".heic",  # Apple HEIC
+        ".png",  # PNG
+        ".tif",
+        ".tiff",  # TIFF
+    }
+)
 
 # Video file extensions
-VIDEO_EXTENSIONS = [
-    ".mov",  # QuickTime
-    ".mp4",  # MPEG-4
-    ".avi",  # AVI
-    ".m4v",  # Apple Video
-]
+VIDEO_EXTENSIONS = frozenset(
+    {
+        ".mov",  # QuickTime
+        ".mp4",  # MPEG-4
+        ".avi",  # AVI
+        ".m4v",  # Apple Video
+    }
+)
 
 # Sidecar file extensions (metadata, edits, etc.)
-SIDECAR_EXTENSIONS = [
-    ".xmp",  # Adobe XMP sidecar
-    ".photo-edit",  # Photo editing data
-    ".fp2",
-    ".fp3",  # Other sidecar formats
+SIDECAR_EXTENSIONS = frozenset(
+    {
+        ".xmp",  # Adobe XMP sidecar
+        ".photo-edit",  # Photo editing data
+        ".fp2",
+        ".fp3",  # Other sidecar formats
+    }
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    """
+    Lowercase extension sets used to classify files during an import.
+    Functions read the module-level CONFIG once per call, so it can be
+    swapped for a different Config as a whole.
+    """
+
+    photo_exts: frozenset = PHOTO_EXTENSIONS
+    sidecar_exts: frozenset = SIDECAR_EXTENSIONS
+    video_exts: frozenset = VIDEO_EXTENSIONS
+
+
+CONFIG = Config()
+
+# Separators between a base name and an edit suffix, as in DSF7942-1.JPG,
+# DSF7942_edit.JPG, "DSF7942 edited.JPG" or DSF7942(1).JPG; "(" only counts
+# when a ")" follows it
+EDITED_VERSION_SEPARATOR_PATTERN = re.compile(r"[-_ ]|\((?=.*\))", re.DOTALL)
+
+# Metadata keys holding the capture date, in order of preference
+EXIF_DATE_KEYS = [
+    "EXIF:DateTimeOriginal",
+    "EXIF:CreateDate",
+    "QuickTime:CreateDate",  # in case of MOV or MP4
 ]
 
+# Year and month at the start of an EXIF date, e.g. '2025:03:22 10:11:12'
+# or '2025-03-22T10:11:12Z'
+EXIF_DATE_PATTERN = re.compile(r"(\d{4})[-:](\d{2})")
+
+# Tags requested from exiftool when reading capture dates in bulk
+EXIF_DATE_TAGS = ["DateTimeOriginal", "CreateDate"]
+
+# Number of files passed to a single exiftool command
+EXIF_BATCH_SIZE = 500
+
+# Bytes hashed from each end of a file for a quick fingerprint
+FINGERPRINT_SIZE = 64 * 1024
+
+# Files queued per import worker; keeps workers busy without creating a
+# future for every file on the card up front
+IN_FLIGHT_PER_WORKER = 4
+
+# Buffer size for reading and copying files; sequential SD card reads
+# are fastest with large chunks
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Largest chunk handed to a single in-kernel copy call
+KERNEL_COPY_CHUNK = 1024 * 1024 * 1024
+
+# Files at least this large are memory-mapped for hashing instead of read
+# in chunks; below it the mmap setup costs more than it saves
+MMAP_HASH_THRESHOLD = 16 * 1024 * 1024
+
 # -----------------------------------------
 # 1. EXIF Functions
 # -----------------------------------------
 
 
-def get_exif_date(image_path):
+def current_year_month():
     """
-    Attempt to retrieve 'DateTimeOriginal' (or a fallback) from the file's metadata.
-    Returns (year, month) as strings, or None if not found.
+    Return the current (year, month) as strings, used for files without a
+    usable capture date.
     """
-    metadata_keys = [
-        "EXIF:DateTimeOriginal",
-        "EXIF:CreateDate",
-        "QuickTime:CreateDate",  # in case of MOV or MP4
-    ]
+    now = datetime.datetime.now()
+    return now.strftime("%Y"), now.strftime("%m")
 
-    try:
-        with exiftool.ExifTool() as et:
-            metadata = et.execute_json("-j", "-n", str(image_path))[0]
-    except Exception as e:
-        console.print(
-            f"[bold red]ERROR[/] Failed to read metadata from {image_path.name}: {str(e)}"
-        )
-        # Fallback: if we can't read metadata, use current date
-        now = datetime.datetime.now()
-        return now.strftime("%Y"), now.strftime("%m")
 
+def _parse_exif_date(metadata, fallback=None):
+    """
+    Extract (year, month) as strings from an exiftool metadata dict.
+    Returns fallback, or the current date if not given, when no usable
+    date is found.
+    """
     # Look for a known date key
     date_str = None
-    for key in metadata_keys:
+    for key in EXIF_DATE_KEYS:
         if key in metadata:
             date_str = metadata[key]
             break
 
     if not date_str:
         # Fallback: if we can't find any date in metadata, use current date
-        now = datetime.datetime.now()
-        return now.strftime("%Y"), now.strftime("%m")
+        return fallback or current_year_month()
 
     # date_str might be in format '2025:03:22 10:11:12' or '2025-03-22T10:11:12Z'
-    # We just need year, month. We'll do a parse approach:
-    date_str_clean = date_str.replace("-", ":").replace("T", " ")
-    # We expect something like 'YYYY:MM:DD HH:MM:SS' now
-    parts = date_str_clean.split()
-    date_part = parts[0].split(":")  # [YYYY, MM, DD]
-
-    if len(date_part) >= 2:
-        year = date_part[0]
-        month = date_part[1]
-        return year, month
+    # We just need year, month
+    match = EXIF_DATE_PATTERN.match(str(date_str))
+    if match:
+        return match.group(1), match.group(2)
     else:
         # Fallback if unexpected format
-        now = datetime.datetime.now()
-        return now.strftime("%Y"), now.strftime("%m")
+        return fallback or current_year_month()
+
+
+def get_exif_date(image_path):
+    """
+    Attempt to retrieve 'DateTimeOriginal' (or a fallback) from the file's metadata.
+    Returns (year, month) as strings, or None if not found.
+    """
+    try:
+        with exiftool.ExifTool() as et:
+            metadata = et.execute_json("-j", "-n", str(image_path))[0]
+    except Exception as e:
+        console.print(
+            f"[bold red]ERROR[/] Failed to read metadata from {image_path.name}: {str(e)}"
+        )
+        # Fallback: if we can't read metadata, use current date
+        return current_year_month()
+
+    return _parse_exif_date(metadata)
+
+
+def _source_file_key(path):
+    """
+    Normalize a path for matching exiftool's SourceFile against the path it
+    was given; exiftool may spell it differently, e.g. with forward slashes
+    on Windows.
+    """
+    return os.path.normcase(os.path.normpath(os.fspath(path)))
+
+
+def get_exif_dates(image_paths, batch_size=EXIF_BATCH_SIZE):
+    """
+    Retrieve capture dates for many files using a single exiftool process.
+    Paths are sent in batches so exiftool's startup cost is paid once per run
+    instead of once per file.
+    Returns a dict mapping each path to (year, month) as strings.
+    """
+    image_paths = list(image_paths)
+    dates = {}
+    # The fallback date is the same for the whole run, compute it once
+    fallback = current_year_month()
+
+    try:
+        with exiftool.ExifToolHelper(check_execute=False) as et:
+            for start in range(0, len(image_paths), batch_size):
+                batch = image_paths[start : start + batch_size]
+                # exiftool reports each result under its own spelling of the path
+                paths_by_key = {_source_file_key(path): path for path in batch}
+                try:
+                    results = et.get_tags(
+                        [str(path) for path in batch], tags=EXIF_DATE_TAGS
+                    )
+                except Exception as e:
+                    console.print(
+                        f"[bold red]ERROR[/] Failed to read metadata for {len(batch)} files: {str(e)}"
+                    )
+                    continue
+
+                for metadata in results:
+                    source_file = metadata.get("SourceFile")
+                    if source_file is None:
+                        continue
+                    path = paths_by_key.get(_source_file_key(source_file))
+                    if path is not None:
+                        dates[path] = _parse_exif_date(metadata, fallback)
+    except Exception as e:
+        console.print(f"[bold red]ERROR[/] Failed to start exiftool: {str(e)}")
+
+    # Fallback: files exiftool could not read get the current date
+    for path in image_paths:
+        if path not in dates:
+            dates[path] = fallback
+
+    return dates
 
 
 # -----------------------------------------
@@ -125,11 +272,15 @@ def get_exif_date(image_path):
 # -----------------------------------------
 
 
-def calculate_file_checksum(file_path, algorithm="md5", buffer_size=65536):
+def calculate_file_checksum(file_path, algorithm="xxh3", buffer_size=COPY_BUFFER_SIZE):
     """
     Calculate a file's checksum using the specified algorithm.
+    Defaults to xxh3 (128-bit), which is much faster than md5 and is only
+    used for content comparison, not security.
     """
-    if algorithm == "md5":
+    if algorithm == "xxh3":
+        hash_obj = xxhash.xxh3_128()
+    elif algorithm == "md5":
         hash_obj = hashlib.md5()
     elif algorithm == "sha256":
         hash_obj = hashlib.sha256()
@@ -138,11 +289,17 @@ def calculate_file_checksum(file_path, algorithm="md5", buffer_size=65536):
 
     try:
         with open(file_path, "rb") as f:
-            while True:
-                data = f.read(buffer_size)
-                if not data:
-                    break
-                hash_obj.update(data)
+            if os.fstat(f.fileno()).st_size >= MMAP_HASH_THRESHOLD:
+                # Hash the whole mapping in one update and let the kernel
+                # handle readahead
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hash_obj.update(mm)
+            else:
+                while True:
+                    data = f.read(buffer_size)
+                    if not data:
+                        break
+                    hash_obj.update(data)
         return hash_obj.hexdigest()
     except Exception as e:
         console.print(
@@ -151,37 +308,241 @@ def calculate_file_checksum(file_path, algorithm="md5", buffer_size=65536):
         return None
 
 
-def files_are_identical(src_path, dest_path):
+def calculate_file_fingerprint(file_path, size):
+    """
+    Hash only the first and last FINGERPRINT_SIZE bytes of a file.
+    Cheap way to tell most differing files apart without reading them fully.
+    """
+    hash_obj = xxhash.xxh3_128()
+
+    try:
+        with open(file_path, "rb") as f:
+            hash_obj.update(f.read(FINGERPRINT_SIZE))
+            if size > FINGERPRINT_SIZE:
+                f.seek(max(FINGERPRINT_SIZE, size - FINGERPRINT_SIZE))
+                hash_obj.update(f.read(FINGERPRINT_SIZE))
+        return hash_obj.hexdigest()
+    except Exception as e:
+        console.print(
+            f"[bold red]ERROR[/] Failed to calculate fingerprint for {file_path}: {str(e)}"
+        )
+        return None
+
+
+def compare_file_contents(path_a, path_b, chunk_size=COPY_BUFFER_SIZE):
     """
-    Compare two files using checksum to determine if they're identical.
+    Byte-compare two files through read-only memory maps, chunk_size bytes
+    at a time, stopping at the first difference.
+    Returns False if the sizes differ or either file can't be read.
     """
-    if not dest_path.exists():
+    try:
+        with open(path_a, "rb") as fa, open(path_b, "rb") as fb:
+            size = os.fstat(fa.fileno()).st_size
+            if size != os.fstat(fb.fileno()).st_size:
+                return False
+            if size == 0:
+                # Empty files can't be mapped
+                return True
+
+            with mmap.mmap(fa.fileno(), 0, access=mmap.ACCESS_READ) as map_a, mmap.mmap(
+                fb.fileno(), 0, access=mmap.ACCESS_READ
+            ) as map_b:
+                # Slicing a mmap gives bytes, whose == is a memcmp; comparing
+                # memoryviews goes item by item and is several times slower
+                for offset in range(0, size, chunk_size):
+                    end = offset + chunk_size
+                    if map_a[offset:end] != map_b[offset:end]:
+                        return False
+                return True
+    except (OSError, ValueError) as e:
+        console.print(
+            f"[bold red]ERROR[/] Failed to compare {path_a} and {path_b}: {str(e)}"
+        )
+        return False
+
+
+def files_are_identical(src_path, dest_path, src_stat=None, compare_executor=None):
+    """
+    Compare two files to determine if they're identical, from cheapest to
+    most expensive check: size, inode, modification time, head/tail
+    fingerprint and finally a full byte comparison.
+    src_stat can be passed to reuse a stat already taken while scanning.
+    If compare_executor is given, the full comparison runs there, e.g. in
+    a process pool so it isn't limited by the GIL.
+    """
+    try:
+        dest_stat = os.stat(dest_path)
+    except OSError:
         return False
 
+    if src_stat is None:
+        src_stat = os.stat(src_path)
+
     # First quick check: compare file sizes
-    if src_path.stat().st_size != dest_path.stat().st_size:
+    size = src_stat.st_size
+    if size != dest_stat.st_size:
         return False
 
-    # Then do the more expensive checksum comparison
-    src_checksum = calculate_file_checksum(src_path)
-    dest_checksum = calculate_file_checksum(dest_path)
+    # Same inode on the same device (e.g. a hardlink) is the same file
+    if os.path.samestat(src_stat, dest_stat):
+        return True
+
+    # Copies keep the source mtime, so a matching mtime means this file
+    # was already imported by a previous run
+    if src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return True
+
+    # Compare the start and end of both files before reading them fully
+    src_fingerprint = calculate_file_fingerprint(src_path, size)
+    dest_fingerprint = calculate_file_fingerprint(dest_path, size)
+    if not src_fingerprint or src_fingerprint != dest_fingerprint:
+        return False
+    if size <= 2 * FINGERPRINT_SIZE:
+        # The fingerprint already covered the whole file
+        return True
+
+    # Finally compare the whole files, stopping at the first difference
+    if compare_executor is not None:
+        return compare_executor.submit(
+            compare_file_contents, src_path, dest_path
+        ).result()
+    return compare_file_contents(src_path, dest_path)
+
+
+def _kernel_copy_loop(copy_chunk):
+    """
+    Call copy_chunk() until it reports 0 bytes copied.
+    Returns False if the first call fails because the kernel or filesystem
+    doesn't support it; nothing is written then.
+    """
+    copied = 0
+    try:
+        while True:
+            count = copy_chunk()
+            if count == 0:
+                return True
+            copied += count
+    except OSError as e:
+        if copied == 0 and e.errno in (
+            errno.ENOSYS,
+            errno.EXDEV,
+            errno.EINVAL,
+            errno.EOPNOTSUPP,
+            errno.ETXTBSY,
+        ):
+            return False
+        raise
+
+
+def _kernel_copy(src_fd, dest_fd):
+    """
+    Copy all data from src_fd to dest_fd without passing it through Python.
+    Uses copy_file_range on Linux (which can also reflink on btrfs/XFS),
+    then sendfile where copy_file_range can't cross filesystems (Linux
+    before 5.3), and fcopyfile on macOS.
+    Returns False if no in-kernel copy is available; nothing is written then.
+    """
+    if hasattr(os, "copy_file_range") and _kernel_copy_loop(
+        lambda: os.copy_file_range(src_fd, dest_fd, KERNEL_COPY_CHUNK)
+    ):
+        return True
+
+    # sendfile only accepts a regular file as output on Linux
+    if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+        if _kernel_copy_loop(
+            lambda: os.sendfile(dest_fd, src_fd, None, KERNEL_COPY_CHUNK)
+        ):
+            return True
+
+    if posix is not None and hasattr(posix, "_fcopyfile"):
+        try:
+            posix._fcopyfile(src_fd, dest_fd, posix._COPYFILE_DATA)
+            return True
+        except OSError as e:
+            if e.errno in (errno.EINVAL, errno.ENOTSUP):
+                return False
+            raise
 
-    if src_checksum and dest_checksum:
-        return src_checksum == dest_checksum
     return False
 
 
+def fast_copy(src_path, dest_path):
+    """
+    Copy a file's contents, permission bits and timestamps.
+    Lets the kernel copy the data where possible and otherwise falls back to
+    a buffered copy with COPY_BUFFER_SIZE chunks.
+    """
+    with open(src_path, "rb") as fsrc:
+        src_stat = os.fstat(fsrc.fileno())
+        # Open without truncating so a file is never copied onto itself
+        dest_fd = os.open(
+            dest_path, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666
+        )
+        with open(dest_fd, "wb") as fdst:
+            if os.path.samestat(src_stat, os.fstat(dest_fd)):
+                raise shutil.SameFileError(
+                    f"{src_path} and {dest_path} are the same file"
+                )
+            fdst.truncate()
+
+            if not _kernel_copy(fsrc.fileno(), dest_fd):
+                shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+
+            if hasattr(os, "fchmod") and os.utime in os.supports_fd:
+                # Set mode and times on the open file instead of shutil.copystat,
+                # which looks the path up again for every call and also copies
+                # flags and extended attributes
+                fdst.flush()
+                os.fchmod(dest_fd, stat.S_IMODE(src_stat.st_mode))
+                os.utime(dest_fd, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+                return
+
+    shutil.copystat(src_path, dest_path)
+
+
+# Destination folders already known to exist, so repeated copies into the
+# same folder don't need a stat or mkdir each time
+_ensured_dirs = set()
+
+
+def _ensure_dir(folder):
+    """Create folder and its parents unless it is already in _ensured_dirs."""
+    folder = os.fspath(folder)
+    if folder not in _ensured_dirs:
+        os.makedirs(folder, exist_ok=True)
+        _ensured_dirs.add(folder)
+
+
+def list_folder_names(folder):
+    """
+    Return the set of casefolded entry names in folder from a single
+    os.scandir pass, so checking whether a file exists there doesn't need a
+    stat per name. Names are casefolded because destination volumes are
+    often case-insensitive (APFS, HFS+, exFAT), where DSF7942.jpg and
+    DSF7942.JPG are the same file; check with name.casefold().
+    """
+    with os.scandir(folder) as entries:
+        return {entry.name.casefold() for entry in entries}
+
+
 def build_destination_folder(root_folder, year, month):
     """
     Create and return a path like /root_folder/2025.03
-    Returns Path object or raises an exception if folder cannot be created
+    Returns tuple: (Path object, was_created) where was_created is False if the
+    folder already existed, or raises an exception if folder cannot be created
     """
     folder_name = f"{year}.{month}"
     dest_path = Path(root_folder) / folder_name
 
     try:
-        dest_path.mkdir(parents=True, exist_ok=True)
-        return dest_path
+        dest_path.mkdir(parents=True)
+        _ensured_dirs.add(os.fspath(dest_path))
+        return dest_path, True
+    except FileExistsError as e:
+        if dest_path.is_dir():
+            _ensured_dirs.add(os.fspath(dest_path))
+            return dest_path, False
+        raise OSError(f"Failed to create folder {dest_path}: {str(e)}")
     except OSError as e:
         if e.errno == 6:  # Device not configured
             raise OSError(
@@ -193,220 +554,423 @@ def build_destination_folder(root_folder, year, month):
         raise Exception(f"Failed to create folder {dest_path}: {str(e)}")
 
 
+@contextlib.contextmanager
+def queued_logging():
+    """
+    Send `logger` records to the rich console through a queue.
+
+    Worker threads only put records on the queue; a single listener thread
+    drains it and prints them, so workers never wait on the console.
+    """
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        RichHandler(
+            console=console,
+            markup=True,
+            show_time=False,
+            show_level=False,
+            show_path=False,
+        ),
+    )
+    logger.addHandler(queue_handler)
+    listener.start()
+    try:
+        yield
+    finally:
+        # stop() flushes whatever is still queued before returning
+        listener.stop()
+        logger.removeHandler(queue_handler)
+
+
+def walk_files(root, extensions=None):
+    """
+    Recursively yield (Path, os.stat_result) for regular files under root.
+    Uses os.scandir, so directories are recognized from the listing itself
+    and only yielded files are stat'ed; the stat can be reused by later checks.
+    If extensions is given, only files with one of those lowercase
+    extensions are yielded. Subdirectories that can't be read (e.g.
+    .Trashes on a volume root) are skipped, like Path.rglob does.
+    """
+    pending = [root]
+    while pending:
+        folder = pending.pop()
+        try:
+            entries = os.scandir(folder)
+        except PermissionError:
+            if folder is root:
+                raise
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file():
+                    if (
+                        extensions is not None
+                        and os.path.splitext(entry.name)[1].lower() not in extensions
+                    ):
+                        continue
+                    yield Path(entry.path), entry.stat()
+
+
+def _sibling_keys(stem):
+    """
+    Yield the lowercase base names a file may belong to: its own stem, plus
+    every prefix that ends right before an edit separator.
+    """
+    stem_lower = stem.lower()
+    yield stem_lower
+    for match in EDITED_VERSION_SEPARATOR_PATTERN.finditer(stem_lower, 1):
+        yield stem_lower[: match.start()]
+
+
+def index_siblings(file_paths):
+    """
+    Group files by parent directory and by the base names they may belong to.
+    Returns {parent: {base_name_lower: [paths]}}, so the sidecars and edited
+    versions of a file can be looked up without rescanning its directory.
+    """
+    index = {}
+    for path in file_paths:
+        by_base = index.setdefault(path.parent, {})
+        for key in _sibling_keys(path.stem):
+            by_base.setdefault(key, []).append(path)
+    return index
+
+
+def _index_dir(folder):
+    """
+    Index the regular files directly inside folder like index_siblings(),
+    with one os.scandir pass. Cached so that files from the same folder
+    don't rescan it; the cache is keyed by the folder's mtime, so adding,
+    removing or renaming files there gives a fresh listing.
+    """
+    return _index_dir_listing(folder, os.stat(folder).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _index_dir_listing(folder, mtime_ns):
+    # DirEntry.is_file() uses the type from the listing instead of a stat
+    with os.scandir(folder) as entries:
+        return index_siblings(
+            folder / entry.name
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+        ).get(folder, {})
+
+
+def find_related_files(src_file, siblings, config=None):
+    """
+    Find the files that belong with src_file, case-insensitively.
+    siblings is the entry of index_siblings() for src_file's directory.
+    config defaults to CONFIG.
+    Returns tuple: (same_stem_files, edited_versions) where same_stem_files are
+    sidecars and same-stem photos/videos (e.g. RAW + JPG pairs from camera),
+    and edited_versions are photos/videos like basename-1.jpg or basename(1).png.
+    """
+    if config is None:
+        config = CONFIG
+    media_exts = config.photo_exts | config.video_exts
+    sidecar_exts = config.sidecar_exts
+    base_name_lower = src_file.stem.lower()  # e.g. "dscf001" from "DSCF001.RAF"
+    same_stem_files = []
+    edited_versions = []
+
+    # Same-stem files plus edited versions like DSF7942-1.JPG, DSF7942_1.JPG,
+    # "DSF7942 edited.JPG" and DSF7942(1).JPG
+    for file_path in siblings.get(base_name_lower, []):
+        extension = file_path.suffix.lower()
+        # For edited versions, we want to copy all image and video formats
+        is_media = extension in media_exts
+
+        if file_path.stem.lower() == base_name_lower:
+            if file_path != src_file and (is_media or extension in sidecar_exts):
+                same_stem_files.append(file_path)
+        elif is_media:
+            edited_versions.append(file_path)
+
+    return same_stem_files, edited_versions
+
+
 def move_file_and_sidecars(
-    src_file, dest_folder, sidecar_exts=None, verbose=False, progress=None, task_id=None
+    src_file,
+    dest_folder,
+    sidecar_exts=None,
+    verbose=False,
+    siblings=None,
+    file_stats=None,
+    compare_executor=None,
+    dest_names=None,
+    log=None,
 ):
     """
     Copy the main file plus any sidecar files that share the same base name.
     Also copies edited versions that follow patterns like basename-1.jpg, basename-HDR.heic, etc.
+    dest_folder is created if it doesn't exist yet.
+    siblings is the entry of index_siblings() for src_file's directory; the
+    cached _index_dir() listing is used when it is not given.
+    file_stats optionally maps source paths to stats taken by walk_files().
+    compare_executor is passed on to files_are_identical().
+    dest_names is the set of casefolded names in dest_folder from
+    list_folder_names(); it answers existence checks instead of the disk
+    and is updated with every copied file. dest_folder is listed once when
+    it is not given.
+    log is the callable messages are printed with, console.print by default;
+    the import passes its queued logger so a file's header and copy lines
+    come out in order.
     Returns tuple: (success, copied_sidecars_count, already_exists)
     """
-    if sidecar_exts is None:
-        sidecar_exts = SIDECAR_EXTENSIONS
+    if log is None:
+        log = console.print
+
+    # Read the global once; the loops below only use the local
+    config = CONFIG
+    if sidecar_exts is not None:
+        config = dataclasses.replace(
+            config, sidecar_exts=frozenset(ext.lower() for ext in sidecar_exts)
+        )
+    if file_stats is None:
+        file_stats = {}
 
-    base_name = src_file.stem  # e.g. "DSCF001" from "DSCF001.RAF"
     src_parent = src_file.parent
-
-    # Check if file already exists with same content
-    dest_file_path = dest_folder / src_file.name
-    if dest_file_path.exists():
-        if files_are_identical(src_file, dest_file_path):
-            if verbose:
-                console.print(
-                    f"  [yellow]SKIP[/] {src_file.name} (identical file already exists)"
-                )
-            return True, 0, True
-        else:
-            console.print(
-                f"  [bold yellow]WARNING[/] File with same name exists but content differs: {src_file.name}"
-            )
-
-    # Copy the main file
+    # Destination paths are built as plain strings; joining and checking
+    # str paths avoids creating a Path object for every file
+    dest_folder_str = os.fspath(dest_folder)
     try:
-        shutil.copy2(str(src_file), str(dest_folder / src_file.name))
-        if verbose:
-            console.print(f"  [green]Copied[/] main file: {src_file.name}")
+        _ensure_dir(dest_folder_str)
     except OSError as e:
         if e.errno == 6:  # Device not configured
-            console.print(
-                f"  [bold red]ERROR[/] Device disconnected while copying {src_file.name}"
+            log(
+                f"  [bold red]ERROR[/] Destination drive disconnected while creating folder {dest_folder_str}"
             )
         else:
-            console.print(
-                f"  [bold red]ERROR[/] Failed to copy {src_file.name}: {str(e)}"
+            log(
+                f"  [bold red]ERROR[/] Failed to create folder {dest_folder_str}: {str(e)}"
             )
         return False, 0, False
+    if dest_names is None:
+        try:
+            dest_names = list_folder_names(dest_folder_str)
+        except OSError as e:
+            if e.errno == 6:  # Device not configured
+                log(
+                    f"  [bold red]ERROR[/] Device disconnected while listing {dest_folder_str}"
+                )
+            else:
+                log(
+                    f"  [bold red]ERROR[/] Failed to list folder {dest_folder_str}: {str(e)}"
+                )
+            return False, 0, False
 
-    # Count copied sidecars for reporting
-    copied_sidecars = 0
-    # Track which sidecars have been copied to avoid duplicates
-    copied_sidecar_paths = set()
-
-    # Copy sidecar files - search in case-insensitive way
-    all_files_in_parent = list(src_parent.glob("*"))
-    base_name_lower = base_name.lower()
-
-    # Pattern matching for edited versions with suffixes
-    edited_versions_patterns = [
-        f"{base_name}-*.*",  # For patterns like DSF7942-1.JPG, DSF7942-HDR.HEIC
-        f"{base_name}_*.*",  # For patterns like DSF7942_1.JPG
-        f"{base_name} *.*",  # For patterns like "DSF7942 edited.JPG"
-        f"{base_name}(*)*.*",  # For patterns like DSF7942(1).JPG
-    ]
-
-    # First copy standard sidecars and same-stem photos
-    for file_path in all_files_in_parent:
-        if not file_path.is_file():
-            continue
+    # Verbose messages are printed together when the call returns, instead
+    # of going through the console for every file; warnings and errors are
+    # still printed right away
+    verbose_messages = []
+    try:
+        # Check if file already exists with same content
+        dest_file_path = os.path.join(dest_folder_str, src_file.name)
+        if src_file.name.casefold() in dest_names:
+            if files_are_identical(
+                src_file,
+                dest_file_path,
+                src_stat=file_stats.get(src_file),
+                compare_executor=compare_executor,
+            ):
+                if verbose:
+                    verbose_messages.append(
+                        f"  [yellow]SKIP[/] {src_file.name} (identical file already exists)"
+                    )
+                return True, 0, True
+            else:
+                log(
+                    f"  [bold yellow]WARNING[/] File with same name exists but content differs: {src_file.name}"
+                )
 
-        # Check if this is a sidecar for our main file or a same-stem photo
-        if file_path.stem.lower() == base_name_lower and file_path != src_file:
-            extension = file_path.suffix.lower()
+        # Copy the main file
+        try:
+            fast_copy(src_file, dest_file_path)
+            dest_names.add(src_file.name.casefold())
+            if verbose:
+                verbose_messages.append(
+                    f"  [green]Copied[/] main file: {src_file.name}"
+                )
+        except OSError as e:
+            if e.errno == 6:  # Device not configured
+                log(
+                    f"  [bold red]ERROR[/] Device disconnected while copying {src_file.name}"
+                )
+            else:
+                log(f"  [bold red]ERROR[/] Failed to copy {src_file.name}: {str(e)}")
+            return False, 0, False
+
+        # Count copied sidecars for reporting
+        copied_sidecars = 0
+
+        # Copy sidecar files - search in case-insensitive way
+        if siblings is None:
+            siblings = _index_dir(src_parent)
+        same_stem_files, edited_versions = find_related_files(
+            src_file, siblings, config
+        )
 
+        # First copy standard sidecars and same-stem photos
+        for file_path in same_stem_files:
             # Handle both sidecars and same-stem photos (e.g., RAW + JPG pairs from camera)
-            is_sidecar = extension in [ext.lower() for ext in sidecar_exts]
-            is_photo = extension in [ext.lower() for ext in PHOTO_EXTENSIONS]
-            is_video = extension in [ext.lower() for ext in VIDEO_EXTENSIONS]
-
-            if is_sidecar or is_photo or is_video:
-                # Skip if we've already copied this file (normalized path)
-                norm_path = str(file_path).lower()
-                if norm_path in copied_sidecar_paths:
-                    continue
-
-                # Check if file already exists with same content
-                dest_path = dest_folder / file_path.name
-                if dest_path.exists() and files_are_identical(file_path, dest_path):
-                    if verbose:
-                        if is_sidecar:
-                            console.print(
-                                f"  [yellow]SKIP[/] Sidecar {file_path.name} (identical file already exists)"
-                            )
-                        else:
-                            console.print(
-                                f"  [yellow]SKIP[/] Same-stem photo {file_path.name} (identical file already exists)"
-                            )
-                    continue
-
-                try:
-                    shutil.copy2(str(file_path), str(dest_folder / file_path.name))
-                    copied_sidecars += 1
-                    copied_sidecar_paths.add(norm_path)
-                    if verbose:
-                        if is_sidecar:
-                            console.print(
-                                f"  [green]Copied[/] sidecar: {file_path.name}"
-                            )
-                        else:
-                            console.print(
-                                f"  [green]Copied[/] same-stem photo: {file_path.name}"
-                            )
-                except OSError as e:
-                    if e.errno == 6:  # Device not configured
-                        console.print(
-                            f"  [bold red]ERROR[/] Device disconnected while copying {file_path.name}"
+            is_sidecar = file_path.suffix.lower() in config.sidecar_exts
+
+            # Check if file already exists with same content
+            dest_path = os.path.join(dest_folder_str, file_path.name)
+            if file_path.name.casefold() in dest_names and files_are_identical(
+                file_path,
+                dest_path,
+                src_stat=file_stats.get(file_path),
+                compare_executor=compare_executor,
+            ):
+                if verbose:
+                    if is_sidecar:
+                        verbose_messages.append(
+                            f"  [yellow]SKIP[/] Sidecar {file_path.name} (identical file already exists)"
                         )
-                        return False, copied_sidecars, False
                     else:
-                        console.print(
-                            f"  [bold red]ERROR[/] Failed to copy {file_path.name}: {str(e)}"
+                        verbose_messages.append(
+                            f"  [yellow]SKIP[/] Same-stem photo {file_path.name} (identical file already exists)"
                         )
-
-    # Next, look for edited versions with suffixes
-    for pattern in edited_versions_patterns:
-        for edited_file in src_parent.glob(pattern):
-            if not edited_file.is_file() or edited_file == src_file:
                 continue
 
-            # Skip if we've already copied this file (normalized path)
-            norm_path = str(edited_file).lower()
-            if norm_path in copied_sidecar_paths:
-                continue
-
-            # For edited versions, we want to copy all image and video formats
-            extension = edited_file.suffix.lower()
-            if extension not in [
-                ext.lower() for ext in PHOTO_EXTENSIONS + VIDEO_EXTENSIONS
-            ]:
-                continue
+            try:
+                fast_copy(file_path, dest_path)
+                dest_names.add(file_path.name.casefold())
+                copied_sidecars += 1
+                if verbose:
+                    if is_sidecar:
+                        verbose_messages.append(
+                            f"  [green]Copied[/] sidecar: {file_path.name}"
+                        )
+                    else:
+                        verbose_messages.append(
+                            f"  [green]Copied[/] same-stem photo: {file_path.name}"
+                        )
+            except OSError as e:
+                if e.errno == 6:  # Device not configured
+                    log(
+                        f"  [bold red]ERROR[/] Device disconnected while copying {file_path.name}"
+                    )
+                    return False, copied_sidecars, False
+                else:
+                    log(
+                        f"  [bold red]ERROR[/] Failed to copy {file_path.name}: {str(e)}"
+                    )
 
+        # Next, copy edited versions with suffixes
+        for edited_file in edited_versions:
             # Check if edited version already exists with same content
-            edited_dest_path = dest_folder / edited_file.name
-            if edited_dest_path.exists() and files_are_identical(
-                edited_file, edited_dest_path
+            edited_dest_path = os.path.join(dest_folder_str, edited_file.name)
+            if edited_file.name.casefold() in dest_names and files_are_identical(
+                edited_file,
+                edited_dest_path,
+                src_stat=file_stats.get(edited_file),
+                compare_executor=compare_executor,
             ):
                 if verbose:
-                    console.print(
+                    verbose_messages.append(
                         f"  [yellow]SKIP[/] Edited version {edited_file.name} (identical file already exists)"
                     )
                 continue
 
             try:
-                shutil.copy2(str(edited_file), str(dest_folder / edited_file.name))
+                fast_copy(edited_file, edited_dest_path)
+                dest_names.add(edited_file.name.casefold())
                 copied_sidecars += 1
-                copied_sidecar_paths.add(norm_path)
                 if verbose:
-                    console.print(
+                    verbose_messages.append(
                         f"  [green]Copied[/] edited version: {edited_file.name}"
                     )
             except OSError as e:
                 if e.errno == 6:  # Device not configured
-                    console.print(
+                    log(
                         f"  [bold red]ERROR[/] Device disconnected while copying edited version {edited_file.name}"
                     )
                     return False, copied_sidecars, False
                 else:
-                    console.print(
+                    log(
                         f"  [bold red]ERROR[/] Failed to copy edited version {edited_file.name}: {str(e)}"
                     )
 
-    # Also try direct matching with common patterns for standard sidecars
-    for ext in sidecar_exts:
-        # Try both lower and upper case versions of the extension
-        for test_ext in [ext.lower(), ext.upper()]:
-            sidecar_path = src_parent / f"{base_name}{test_ext}"
-            # Skip if we've already copied this file (normalized path)
-            norm_path = str(sidecar_path).lower()
-            if norm_path in copied_sidecar_paths:
-                continue
+        return True, copied_sidecars, False
+    finally:
+        if verbose_messages:
+            log("\n".join(verbose_messages))
 
-            if sidecar_path.exists() and sidecar_path != src_file:
-                # Check if sidecar already exists with same content
-                sidecar_dest_path = dest_folder / sidecar_path.name
-                if sidecar_dest_path.exists() and files_are_identical(
-                    sidecar_path, sidecar_dest_path
-                ):
-                    if verbose:
-                        console.print(
-                            f"  [yellow]SKIP[/] Sidecar {sidecar_path.name} (identical file already exists)"
-                        )
-                    continue
 
-                try:
-                    shutil.copy2(
-                        str(sidecar_path), str(dest_folder / sidecar_path.name)
-                    )
-                    copied_sidecars += 1
-                    copied_sidecar_paths.add(norm_path)
-                    if verbose:
-                        console.print(
-                            f"  [green]Copied[/] sidecar: {sidecar_path.name}"
-                        )
-                except OSError as e:
-                    if e.errno == 6:  # Device not configured
-                        console.print(
-                            f"  [bold red]ERROR[/] Device disconnected while copying sidecar {sidecar_path.name}"
-                        )
-                        return False, copied_sidecars, False
-                    else:
-                        console.print(
-                            f"  [bold red]ERROR[/] Failed to copy sidecar {sidecar_path.name}: {str(e)}"
-                        )
+def move_files_batch(src_files, dest_folder, max_workers=None, verbose=False):
+    """
+    Copy several main files and their sidecars to dest_folder concurrently,
+    one move_file_and_sidecars() call per worker so each file's group is
+    still copied in order.
+    Returns a dict with copied_files, copied_sidecars, skipped_existing and
+    failed_files counts.
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    counts = {
+        "copied_files": 0,
+        "copied_sidecars": 0,
+        "skipped_existing": 0,
+        "failed_files": 0,
+    }
+    lock = threading.Lock()
+    # Directory mtimes can be too coarse to notice files added right after
+    # an earlier call, and folders may have been removed since, so every
+    # batch starts from fresh listings
+    _index_dir_listing.cache_clear()
+    _ensured_dirs.clear()
+
+    # List the destination once and share the names between all workers;
+    # if that fails, none of the files can be copied
+    src_files = list(src_files)
+    try:
+        _ensure_dir(dest_folder)
+        dest_names = list_folder_names(dest_folder)
+    except OSError as e:
+        if e.errno == 6:  # Device not configured
+            console.print(
+                f"  [bold red]ERROR[/] Destination drive disconnected while opening {dest_folder}"
+            )
+        else:
+            console.print(
+                f"  [bold red]ERROR[/] Failed to open folder {dest_folder}: {str(e)}"
+            )
+        counts["failed_files"] = len(src_files)
+        return counts
+
+    def move_one(src_file):
+        try:
+            success, sidecar_count, already_exists = move_file_and_sidecars(
+                src_file, dest_folder, verbose=verbose, dest_names=dest_names
+            )
+        except Exception as e:
+            console.print(
+                f"  [bold red]ERROR[/] Failed to process {src_file.name}: {str(e)}"
+            )
+            success, sidecar_count, already_exists = False, 0, False
+
+        with lock:
+            if already_exists:
+                counts["skipped_existing"] += 1
+            elif success:
+                counts["copied_files"] += 1
+                counts["copied_sidecars"] += sidecar_count
+            else:
+                counts["failed_files"] += 1
 
-    if progress and task_id:
-        progress.update(task_id, advance=1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list() waits for every copy to finish
+        list(executor.map(move_one, src_files))
 
-    return True, copied_sidecars, False
+    return counts
 
 
 # -----------------------------------------
@@ -414,15 +978,22 @@ def move_file_and_sidecars(
 # -----------------------------------------
 
 
-def import_from_sd(sd_folder, ssd_root, skip_mov=False, verbose=False, max_workers=4):
+def import_from_sd(
+    sd_folder, ssd_root, skip_mov=False, verbose=False, max_workers=4, use_rsync=False
+):
     """
     Organize photos by YYYY.MM in ssd_root from sd_folder.
     Recursively scans all subdirectories.
     Optionally skip video files.
-    Uses parallel processing for faster copying.
+    Uses parallel processing for faster copying, or with use_rsync, one rsync
+    call per destination folder.
     """
     sd_folder = Path(sd_folder)
     ssd_root = Path(ssd_root)
+    config = CONFIG
+
+    # Folders may have been removed since a previous import in this session
+    _ensured_dirs.clear()
 
     # Check if source and destination are available
     if not sd_folder.is_dir():
@@ -455,9 +1026,17 @@ def import_from_sd(sd_folder, ssd_root, skip_mov=False, verbose=False, max_worke
                 "[blue]Scanning SD card for files...[/]", expand=False, padding=(1, 2)
             )
         )
-        # Use rglob to recursively search all subdirectories
-        all_files = list(sd_folder.rglob("*"))
-        console.print(f"[green]Found {len(all_files)} total items[/]")
+        # Recursively search all subdirectories, keeping each file's stat;
+        # only photos, videos and sidecars are relevant for the import
+        file_stats = dict(
+            walk_files(
+                sd_folder,
+                config.photo_exts | config.video_exts | config.sidecar_exts,
+            )
+        )
+        console.print(
+            f"[green]Found {len(file_stats)} photo, video and sidecar files[/]"
+        )
         console.print("\n")  # Add spacing after scan results
     except OSError as e:
         console.print(f"\n[bold red]ERROR[/] Failed to scan SD card: {str(e)}")
@@ -466,22 +1045,44 @@ def import_from_sd(sd_folder, ssd_root, skip_mov=False, verbose=False, max_worke
         return
 
     # Identify main files to process - photos and optionally videos
-    main_extensions = PHOTO_EXTENSIONS.copy()
+    # (lowercase for case-insensitive comparison)
+    main_extensions_lower = config.photo_exts
     if not skip_mov:
-        main_extensions.extend(VIDEO_EXTENSIONS)
+        main_extensions_lower = main_extensions_lower | config.video_exts
 
-    # Get all file extensions in lowercase for case-insensitive comparison
-    main_extensions_lower = [ext.lower() for ext in main_extensions]
+    # Index files by directory for sidecar lookups
+    sibling_index = index_siblings(file_stats)
 
     # Filter main files to process
-    files = [
-        f
-        for f in all_files
-        if f.is_file() and f.suffix.lower() in main_extensions_lower
-    ]
+    files = [f for f in file_stats if f.suffix.lower() in main_extensions_lower]
 
     # Count metrics
     total_files = len(files)
+
+    # Read all capture dates up front with one exiftool process
+    with console.status("[bold green]Reading capture dates...", spinner="dots"):
+        exif_dates = get_exif_dates(files)
+
+    # Create each YYYY.MM folder once instead of once per file; a folder
+    # that can't be created fails only the files that belong in it
+    dest_folders = {}
+    dest_folder_errors = {}
+    # Names in each destination folder, listed once here and kept up to date
+    # as files are copied, so existence checks don't need to touch the disk
+    dest_names = {}
+    for year, month in set(exif_dates.values()):
+        try:
+            dest_folder, was_created = build_destination_folder(ssd_root, year, month)
+            # A folder created just now is known to be empty
+            dest_names[year, month] = (
+                set() if was_created else list_folder_names(dest_folder)
+            )
+            dest_folders[year, month] = dest_folder
+        except Exception as e:
+            # Keep only the message; re-raising one shared exception from
+            # every worker would keep growing its traceback
+            dest_folder_errors[year, month] = str(e)
+
     # Using thread-safe counters
     lock = threading.Lock()
     metrics = {
@@ -507,6 +1108,8 @@ def import_from_sd(sd_folder, ssd_root, skip_mov=False, verbose=False, max_worke
     )
     console.print("\n")  # Add spacing after import start panel
 
+    # The log queue is drained before Progress stops, so every message is
+    # printed above the bar instead of after the final one
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -515,59 +1118,49 @@ def import_from_sd(sd_folder, ssd_root, skip_mov=False, verbose=False, max_worke
         TextColumn("[cyan]{task.completed}/{task.total}[/]"),
         TimeElapsedColumn(),
         console=console,
-    ) as progress:
+    ) as progress, queued_logging():
 
         task_id = progress.add_task("[green]Importing files...", total=total_files)
 
         def process_file(file_item):
             nonlocal metrics, skipped_files_list, skipped_existing_list, failed_files_list
 
-            # Check if we should skip this file
-            if not file_item.is_file():
-                if verbose:
-                    console.print(f"[yellow]SKIP[/] {file_item.name} (not a file)")
-                with lock:
-                    metrics["skipped_files"] += 1
-                    skipped_files_list.append((str(file_item), "not a file"))
-                progress.update(task_id, advance=1)
-                return
-
             # Skip videos if requested
-            if skip_mov and file_item.suffix.lower() in [
-                ext.lower() for ext in VIDEO_EXTENSIONS
-            ]:
+            if skip_mov and file_item.suffix.lower() in config.video_exts:
                 if verbose:
-                    console.print(f"[yellow]SKIP[/] {file_item.name} (video file)")
+                    logger.info(f"[yellow]SKIP[/] {file_item.name} (video file)")
                 with lock:
                     metrics["skipped_files"] += 1
                     skipped_files_list.append((str(file_item), "video file"))
-                progress.update(task_id, advance=1)
                 return
 
             if verbose:
-                with lock:
-                    console.print(
-                        f"[blue]Processing[/] {file_item.name} ({metrics['processed_files'] + 1}/{total_files})"
-                    )
+                logger.info(
+                    f"[blue]Processing[/] {file_item.name} ({metrics['processed_files'] + 1}/{total_files})"
+                )
 
             try:
-                # Get date from EXIF
-                year, month = get_exif_date(file_item)
+                # Get date from the EXIF pre-pass
+                year, month = exif_dates[file_item]
 
-                # Build destination folder
-                dest_folder = build_destination_folder(ssd_root, year, month)
+                # Look up the destination folder created for that date
+                if (year, month) in dest_folder_errors:
+                    raise OSError(dest_folder_errors[year, month])
+                dest_folder = dest_folders[year, month]
 
                 if verbose:
-                    console.print(f"  -> Copying to {dest_folder}")
+                    logger.info(f"  -> Copying to {dest_folder}")
 
                 # Copy file + sidecars and count the sidecars
                 success, sidecar_count, already_exists = move_file_and_sidecars(
                     file_item,
                     dest_folder,
-                    SIDECAR_EXTENSIONS,
                     verbose=verbose,
-                    progress=progress,
-                    task_id=task_id,
+                    siblings=sibling_index[file_item.parent],
+                    file_stats=file_stats,
+                    compare_executor=compare_executor,
+                    dest_names=dest_names[year, month],
+                    log=logger.info,
                 )
 
                 with lock:
@@ -575,45 +1168,127 @@ def import_from_sd(sd_folder, ssd_root, skip_mov=False, verbose=False, max_worke
                     if already_exists:
                         metrics["skipped_existing"] += 1
                         skipped_existing_list.append(str(file_item))
-                        if not verbose:
-                            progress.update(task_id, advance=1)
                     elif success:
                         metrics["copied_files"] += 1
                         metrics["copied_sidecars"] += sidecar_count
-                        if not verbose:
-                            progress.update(task_id, advance=1)
                     else:
                         metrics["failed_files"] += 1
                         failed_files_list.append((str(file_item), "copy failed"))
-                        console.print(
-                            f"[bold yellow]WARNING[/] Failed to copy {file_item.name} - device may be disconnected"
-                        )
-                        if not verbose:
-                            progress.update(task_id, advance=1)
+                if not success and not already_exists:
+                    logger.warning(
+                        f"[bold yellow]WARNING[/] Failed to copy {file_item.name} - device may be disconnected"
+                    )
             except Exception as e:
                 with lock:
                     metrics["failed_files"] += 1
                     failed_files_list.append((str(file_item), str(e)))
-                    console.print(
-                        f"[bold red]ERROR[/] Failed to process {file_item.name}: {str(e)}"
-                    )
-                progress.update(task_id, advance=1)
+                logger.error(
+                    f"[bold red]ERROR[/] Failed to process {file_item.name}: {str(e)}"
+                )
 
-        # Use ThreadPoolExecutor for parallel copying
-        # ThreadPoolExecutor is better than ProcessPoolExecutor for I/O bound operations
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all files to the executor
-            futures = [executor.submit(process_file, file_item) for file_item in files]
+        def rsync_group(dest_key, main_files):
+            # Copy a destination folder's main files and everything that
+            # belongs with them in a single rsync call
+            if dest_key in dest_folder_errors:
+                error = dest_folder_errors[dest_key]
+                metrics["failed_files"] += len(main_files)
+                failed_files_list.extend((str(f), error) for f in main_files)
+                return
+            dest_folder = dest_folders[dest_key]
 
-            # Wait for all futures to complete
-            concurrent.futures.wait(futures)
+            group_files = dict.fromkeys(main_files)
+            for file_item in main_files:
+                same_stem_files, edited_versions = find_related_files(
+                    file_item, sibling_index[file_item.parent], config
+                )
+                group_files.update(dict.fromkeys(same_stem_files + edited_versions))
 
-            # Check if any exception was raised
-            for future in futures:
-                if future.exception() is not None:
-                    console.print(
-                        f"[bold red]ERROR[/] Task failed: {future.exception()}"
+            if verbose:
+                console.print(
+                    f"[blue]Syncing[/] {len(group_files)} files to {dest_folder}"
+                )
+
+            error = None
+            try:
+                transferred = rsync_files_to_folder(sd_folder, group_files, dest_folder)
+            except subprocess.CalledProcessError as e:
+                transferred = set(e.stdout.splitlines()) if e.stdout else set()
+                error = f"rsync failed with code {e.returncode}"
+                if e.stderr:
+                    error += f": {e.stderr.strip()}"
+            except OSError as e:
+                transferred = set()
+                error = str(e)
+
+            if verbose:
+                for name in sorted(transferred):
+                    console.print(f"  [green]Copied[/] {name}")
+
+            main_names = {file_item.name for file_item in main_files}
+            for file_item in main_files:
+                metrics["processed_files"] += 1
+                if file_item.name in transferred:
+                    metrics["copied_files"] += 1
+                elif error:
+                    metrics["failed_files"] += 1
+                    failed_files_list.append((str(file_item), error))
+                else:
+                    metrics["skipped_existing"] += 1
+                    skipped_existing_list.append(str(file_item))
+            metrics["copied_sidecars"] += len(
+                {path.name for path in group_files if path.name in transferred}
+                - main_names
+            )
+
+        if use_rsync:
+            # rsync copies with its own buffering and skips files whose size
+            # and mtime already match
+            groups = {}
+            for file_item in files:
+                groups.setdefault(exif_dates[file_item], []).append(file_item)
+
+            for dest_key, main_files in groups.items():
+                rsync_group(dest_key, main_files)
+                progress.update(task_id, advance=len(main_files))
+        else:
+            # Use ThreadPoolExecutor for parallel copying
+            # ThreadPoolExecutor is better than ProcessPoolExecutor for I/O bound operations
+            # Full comparisons fault pages in while holding the GIL, so they go
+            # to a process pool instead; its workers are only started once a
+            # comparison is actually needed. They are spawned rather than
+            # forked: forking from a worker thread while the progress, logging
+            # and copy threads run could leave a child holding a lock (e.g.
+            # the console's) that no thread will ever release
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as compare_executor, concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                # Keep a bounded window of files in flight instead of submitting
+                # everything up front, and advance the progress bar as each finishes
+                pending_files = iter(files)
+                in_flight = {
+                    executor.submit(process_file, file_item)
+                    for file_item in itertools.islice(
+                        pending_files, max_workers * IN_FLIGHT_PER_WORKER
                     )
+                }
+
+                while in_flight:
+                    done, in_flight = concurrent.futures.wait(
+                        in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        progress.update(task_id, advance=1)
+                        if future.exception() is not None:
+                            console.print(
+                                f"[bold red]ERROR[/] Task failed: {future.exception()}"
+                            )
+
+                        file_item = next(pending_files, None)
+                        if file_item is not None:
+                            in_flight.add(executor.submit(process_file, file_item))
 
     # Print summary as a table
     table = Table(title="Import Summary")
@@ -730,6 +1405,40 @@ def rsync_folders(source, destination, exclude_mov=False, do_delete=False):
                 console.print(f"[red]{e.stderr}[/]")
 
 
+def rsync_files_to_folder(src_root, src_files, dest_folder):
+    """
+    Copy src_files, which live under src_root, flat into dest_folder with a
+    single rsync call. Files whose size and mtime already match are skipped.
+    Returns the set of file names rsync transferred, or raises
+    subprocess.CalledProcessError if rsync failed.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".lst", delete=False) as file_list:
+        file_list.write(
+            "\0".join(str(Path(path).relative_to(src_root)) for path in src_files)
+        )
+
+    try:
+        result = subprocess.run(
+            [
+                "rsync",
+                "-a",
+                "--no-relative",  # copy into dest_folder without source subfolders
+                "--from0",
+                f"--files-from={file_list.name}",
+                "--out-format=%n",  # print the name of each transferred file
+                f"{src_root}/",
+                f"{dest_folder}/",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    finally:
+        os.unlink(file_list.name)
+
+    return set(result.stdout.splitlines())
+
+
 # -----------------------------------------
 # 5. Main Interactive CLI with python-inquirer
 # -----------------------------------------
@@ -777,6 +1486,11 @@ def import_menu():
         inquirer.Text(
             "max_workers", message="How many parallel workers to use?", default="8"
         ),
+        inquirer.Confirm(
+            "use_rsync",
+            message="Copy with rsync (one call per month folder)?",
+            default=False,
+        ),
     ]
     return inquirer.prompt(questions)
 
@@ -827,6 +1541,7 @@ def main():
                         skip_mov=ans["skip_mov"],
                         verbose=ans["verbose"],
                         max_workers=int(ans["max_workers"]),
+                        use_rsync=ans["use_rsync"],
                     )
                 except Exception as e:
                     console.print(
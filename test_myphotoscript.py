@@ -1,5 +1,9 @@
+import concurrent.futures
+import errno
+import multiprocessing
 import os
 import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 
@@ -63,7 +67,7 @@ def create_test_files(src_dir):
 
 
 def test_move_file_and_sidecars_edited_versions(
-    temp_directories, mock_console, mock_files_not_identical
+    temp_directories, mock_console, mock_files_not_identical, monkeypatch
 ):
     """Test that edited versions are properly recognized and copied."""
     src_dir, dest_dir = temp_directories
@@ -73,8 +77,13 @@ def test_move_file_and_sidecars_edited_versions(
     raw_file = src_dir / "DSF7942.RAF"
 
     # Make sure we have appropriate extensions defined for testing
-    myphotoscript.PHOTO_EXTENSIONS = [".jpg", ".jpeg", ".heic", ".png", ".raf"]
-    myphotoscript.SIDECAR_EXTENSIONS = [".xmp"]
+    monkeypatch.setattr(
+        myphotoscript,
+        "CONFIG",
+        myphotoscript.Config(
+            frozenset({".jpg", ".jpeg", ".heic", ".png", ".raf"}), frozenset({".xmp"})
+        ),
+    )
 
     # Call function being tested
     success, copied_sidecars, already_exists = myphotoscript.move_file_and_sidecars(
@@ -110,7 +119,9 @@ def test_move_file_and_sidecars_edited_versions(
     assert already_exists is False
 
 
-def test_move_file_and_sidecars_skips_duplicates(temp_directories, mock_console):
+def test_move_file_and_sidecars_skips_duplicates(
+    temp_directories, mock_console, monkeypatch
+):
     """Test that duplicate files are skipped when they already exist in destination."""
     src_dir, dest_dir = temp_directories
 
@@ -119,8 +130,13 @@ def test_move_file_and_sidecars_skips_duplicates(temp_directories, mock_console)
     raw_file = src_dir / "DSF7942.RAF"
 
     # Make sure we have appropriate extensions defined for testing
-    myphotoscript.PHOTO_EXTENSIONS = [".jpg", ".jpeg", ".heic", ".png", ".raf"]
-    myphotoscript.SIDECAR_EXTENSIONS = [".xmp"]
+    monkeypatch.setattr(
+        myphotoscript,
+        "CONFIG",
+        myphotoscript.Config(
+            frozenset({".jpg", ".jpeg", ".heic", ".png", ".raf"}), frozenset({".xmp"})
+        ),
+    )
 
     # Create identical files in destination (to be skipped)
     for src_file in test_files:
@@ -140,7 +156,9 @@ def test_move_file_and_sidecars_skips_duplicates(temp_directories, mock_console)
     assert already_exists is True  # Main file already exists
 
 
-def test_move_file_and_sidecars_handles_errors(temp_directories, mock_console):
+def test_move_file_and_sidecars_handles_errors(
+    temp_directories, mock_console, monkeypatch
+):
     """Test error handling during file copying."""
     src_dir, dest_dir = temp_directories
 
@@ -149,11 +167,16 @@ def test_move_file_and_sidecars_handles_errors(temp_directories, mock_console):
     raw_file = src_dir / "DSF7942.RAF"
 
     # Make sure we have appropriate extensions defined for testing
-    myphotoscript.PHOTO_EXTENSIONS = [".jpg", ".jpeg", ".heic", ".png", ".raf"]
-    myphotoscript.SIDECAR_EXTENSIONS = [".xmp"]
+    monkeypatch.setattr(
+        myphotoscript,
+        "CONFIG",
+        myphotoscript.Config(
+            frozenset({".jpg", ".jpeg", ".heic", ".png", ".raf"}), frozenset({".xmp"})
+        ),
+    )
 
-    # Mock shutil.copy2 to raise an OSError
-    with patch("shutil.copy2", side_effect=OSError("Test error")):
+    # Mock fast_copy to raise an OSError
+    with patch("myphotoscript.fast_copy", side_effect=OSError("Test error")):
         # Call function being tested
         success, copied_sidecars, already_exists = myphotoscript.move_file_and_sidecars(
             raw_file, dest_dir, verbose=True
@@ -170,5 +193,692 @@ def test_move_file_and_sidecars_handles_errors(temp_directories, mock_console):
     )
 
 
+def test_move_files_batch_counts_results(temp_directories, mock_console):
+    """Test that a batch copies every group and aggregates the results."""
+    src_dir, dest_dir = temp_directories
+    for i in range(10):
+        (src_dir / f"DSF{i:04d}.RAF").write_text(f"raw {i}")
+        (src_dir / f"DSF{i:04d}.XMP").write_text(f"xmp {i}")
+    shutil.copy2(src_dir / "DSF0000.RAF", dest_dir / "DSF0000.RAF")
+
+    counts = myphotoscript.move_files_batch(
+        [src_dir / f"DSF{i:04d}.RAF" for i in range(10)], dest_dir, max_workers=4
+    )
+
+    assert counts == {
+        "copied_files": 9,
+        "copied_sidecars": 9,
+        "skipped_existing": 1,
+        "failed_files": 0,
+    }
+    assert len(list(dest_dir.iterdir())) == 19
+
+
+def test_import_from_sd_prints_log_lines_before_final_bar(temp_directories):
+    """Test that queued worker messages are printed before the progress bar ends."""
+    from rich.console import Console
+
+    src_dir, dest_dir = temp_directories
+    for i in range(20):
+        (src_dir / f"DSF{i:04d}.RAF").write_text(f"raw {i}")
+        (src_dir / f"DSF{i:04d}.XMP").write_text(f"xmp {i}")
+
+    record_console = Console(record=True, width=100)
+    with patch("myphotoscript.console", record_console), patch(
+        "myphotoscript.get_exif_dates",
+        side_effect=lambda paths: {path: ("2024", "07") for path in paths},
+    ):
+        myphotoscript.import_from_sd(
+            src_dir, dest_dir / "ssd", verbose=True, max_workers=4
+        )
+
+    lines = record_console.export_text().splitlines()
+    final_bar = max(i for i, line in enumerate(lines) if "Importing files" in line)
+    log_lines = [
+        i for i, line in enumerate(lines) if "Processing" in line or "Copied" in line
+    ]
+    assert len(log_lines) == 60
+    assert max(log_lines) < final_bar
+
+
+def test_import_from_sd_fails_files_of_uncreatable_folder(temp_directories):
+    """Test that every file of a folder that can't be created fails with its error."""
+    from rich.console import Console
+
+    src_dir, dest_dir = temp_directories
+    for i in range(3):
+        (src_dir / f"DSF{i:04d}.RAF").write_text(f"raw {i}")
+    # A file where the 2024.07 folder should be
+    (dest_dir / "2024.07").write_text("not a folder")
+
+    record_console = Console(record=True, width=200)
+    with patch("myphotoscript.console", record_console), patch(
+        "myphotoscript.get_exif_dates",
+        side_effect=lambda paths: {path: ("2024", "07") for path in paths},
+    ):
+        myphotoscript.import_from_sd(src_dir, dest_dir, max_workers=2)
+
+    output = record_console.export_text()
+    assert "│ Items failed                  │ 3" in output
+    assert output.count("Failed to process") == 3
+    assert output.count("Failed to create folder") >= 3
+
+
+def test_move_file_and_sidecars_prints_through_given_log(
+    temp_directories, mock_console
+):
+    """Test that all messages go through log when one is passed."""
+    src_dir, dest_dir = temp_directories
+    (src_dir / "DSF0001.RAF").write_text("raw")
+    (src_dir / "DSF0001.XMP").write_text("xmp")
+    log = MagicMock()
+
+    myphotoscript.move_file_and_sidecars(
+        src_dir / "DSF0001.RAF", dest_dir, verbose=True, log=log
+    )
+
+    mock_console.print.assert_not_called()
+    log.assert_called_once()
+    assert "Copied[/] sidecar: DSF0001.XMP" in log.call_args.args[0]
+
+
+def test_move_files_batch_sees_sidecars_added_between_calls(
+    temp_directories, mock_console
+):
+    """Test that a later batch copies sidecars added after an earlier one."""
+    src_dir, dest_dir = temp_directories
+    (src_dir / "A.RAF").write_text("raw")
+
+    myphotoscript.move_files_batch([src_dir / "A.RAF"], dest_dir / "d1")
+    (src_dir / "A.XMP").write_text("xmp")
+    (src_dir / "A-1.JPG").write_text("edit")
+    counts = myphotoscript.move_files_batch([src_dir / "A.RAF"], dest_dir / "d2")
+
+    assert counts["copied_sidecars"] == 2
+    assert sorted(p.name for p in (dest_dir / "d2").iterdir()) == [
+        "A-1.JPG",
+        "A.RAF",
+        "A.XMP",
+    ]
+
+
+def test_build_destination_folder_reports_new_folders(temp_directories):
+    """Test that only the first call for a YYYY.MM folder reports it as created."""
+    _, dest_dir = temp_directories
+
+    folder, was_created = myphotoscript.build_destination_folder(dest_dir, "2025", "03")
+    assert folder == dest_dir / "2025.03"
+    assert folder.is_dir()
+    assert was_created is True
+
+    folder, was_created = myphotoscript.build_destination_folder(dest_dir, "2025", "03")
+    assert folder == dest_dir / "2025.03"
+    assert was_created is False
+
+
+def test_move_file_and_sidecars_creates_dest_folder_once(
+    temp_directories, mock_console
+):
+    """Test that the destination folder is created on first use only."""
+    src_dir, dest_dir = temp_directories
+    for name in ["DSF0001.RAF", "DSF0002.RAF"]:
+        (src_dir / name).write_text(name)
+    dest_folder = dest_dir / "2025.03"
+
+    with patch("myphotoscript.os.makedirs", wraps=os.makedirs) as mock_makedirs:
+        for name in ["DSF0001.RAF", "DSF0002.RAF"]:
+            myphotoscript.move_file_and_sidecars(src_dir / name, dest_folder)
+
+    mock_makedirs.assert_called_once_with(str(dest_folder), exist_ok=True)
+    assert (dest_folder / "DSF0002.RAF").read_text() == "DSF0002.RAF"
+
+
+def test_move_file_and_sidecars_updates_dest_names(temp_directories, mock_console):
+    """Test that existence checks use the given names and record new copies."""
+    src_dir, dest_dir = temp_directories
+    (src_dir / "DSF0001.RAF").write_text("raw")
+    (src_dir / "DSF0001.XMP").write_text("xmp")
+    dest_names = myphotoscript.list_folder_names(dest_dir)
+
+    with patch("myphotoscript.os.scandir", wraps=os.scandir) as mock_scandir:
+        myphotoscript.move_file_and_sidecars(
+            src_dir / "DSF0001.RAF", dest_dir, dest_names=dest_names
+        )
+
+    scanned = {os.fspath(c.args[0]) for c in mock_scandir.call_args_list}
+    assert os.fspath(dest_dir) not in scanned
+    assert dest_names == {"dsf0001.raf", "dsf0001.xmp"}
+
+
+def test_move_file_and_sidecars_matches_dest_names_case_insensitively(
+    temp_directories, mock_console
+):
+    """Test that a name differing only in case counts as an existing file."""
+    src_dir, dest_dir = temp_directories
+    (src_dir / "DSF0001.JPG").write_text("jpg")
+
+    with patch(
+        "myphotoscript.files_are_identical", return_value=True
+    ) as mock_identical:
+        result = myphotoscript.move_file_and_sidecars(
+            src_dir / "DSF0001.JPG", dest_dir, dest_names={"dsf0001.jpg"}
+        )
+
+    mock_identical.assert_called_once()
+    assert result == (True, 0, True)
+
+
+def test_move_files_batch_lists_dest_folder_once(temp_directories, mock_console):
+    """Test that a batch shares one listing of the destination folder."""
+    src_dir, dest_dir = temp_directories
+    for i in range(5):
+        (src_dir / f"DSF{i:04d}.RAF").write_text(f"raw {i}")
+
+    with patch("myphotoscript.os.scandir", wraps=os.scandir) as mock_scandir:
+        myphotoscript.move_files_batch(
+            [src_dir / f"DSF{i:04d}.RAF" for i in range(5)], dest_dir
+        )
+
+    scanned = [os.fspath(c.args[0]) for c in mock_scandir.call_args_list]
+    assert scanned.count(os.fspath(dest_dir)) == 1
+
+
+def test_move_file_and_sidecars_reports_folder_creation_errors(
+    temp_directories, mock_console
+):
+    """Test that a destination folder that can't be created is reported, not raised."""
+    src_dir, dest_dir = temp_directories
+    (src_dir / "DSF0001.RAF").write_text("raw")
+    # A file where the folder should be
+    blocker = dest_dir / "2025.03"
+    blocker.write_text("not a folder")
+
+    result = myphotoscript.move_file_and_sidecars(
+        src_dir / "DSF0001.RAF", blocker / "sub"
+    )
+
+    assert result == (False, 0, False)
+    assert "Failed to create folder" in mock_console.print.call_args.args[0]
+
+
+def test_move_files_batch_recreates_removed_dest_folder(temp_directories, mock_console):
+    """Test that a batch recreates a destination folder removed after a previous one."""
+    src_dir, dest_dir = temp_directories
+    (src_dir / "DSF0001.RAF").write_text("raw")
+    dest_folder = dest_dir / "2025.03"
+
+    myphotoscript.move_files_batch([src_dir / "DSF0001.RAF"], dest_folder)
+    shutil.rmtree(dest_folder)
+    counts = myphotoscript.move_files_batch([src_dir / "DSF0001.RAF"], dest_folder)
+
+    assert counts["copied_files"] == 1
+    assert (dest_folder / "DSF0001.RAF").read_text() == "raw"
+
+
+@pytest.mark.parametrize(
+    "error, message",
+    [
+        (OSError(6, "Device not configured"), "Device disconnected while listing"),
+        (PermissionError(13, "Permission denied"), "Failed to list folder"),
+    ],
+)
+def test_move_file_and_sidecars_reports_listing_errors(
+    temp_directories, mock_console, error, message
+):
+    """Test that a destination folder that can't be listed is reported, not raised."""
+    src_dir, dest_dir = temp_directories
+    (src_dir / "DSF0001.RAF").write_text("raw")
+
+    with patch("myphotoscript.list_folder_names", side_effect=error):
+        result = myphotoscript.move_file_and_sidecars(src_dir / "DSF0001.RAF", dest_dir)
+
+    assert result == (False, 0, False)
+    assert message in mock_console.print.call_args.args[0]
+
+
+def test_move_files_batch_counts_listing_error_as_failures(
+    temp_directories, mock_console
+):
+    """Test that a batch whose destination can't be listed fails its files."""
+    src_dir, dest_dir = temp_directories
+    src_files = [src_dir / f"DSF{i:04d}.RAF" for i in range(3)]
+    for src_file in src_files:
+        src_file.write_text("raw")
+
+    with patch(
+        "myphotoscript.list_folder_names",
+        side_effect=OSError(6, "Device not configured"),
+    ):
+        counts = myphotoscript.move_files_batch(src_files, dest_dir)
+
+    assert counts["failed_files"] == 3
+    assert counts["copied_files"] == 0
+    mock_console.print.assert_called_once()
+
+
+def test_walk_files_returns_nested_files_with_stats(temp_directories):
+    """Test that walking recurses into subdirectories and keeps file stats."""
+    src_dir, _ = temp_directories
+
+    nested = src_dir / "DCIM" / "100FUJI"
+    nested.mkdir(parents=True)
+    (nested / "DSF7942.RAF").write_bytes(b"raw data")
+    (nested / "DSF7942.THM").write_bytes(b"thumbnail")
+    (src_dir / "DCIM" / "DSF0001.JPG").write_bytes(b"jpg")
+
+    file_stats = dict(myphotoscript.walk_files(src_dir))
+
+    assert set(file_stats) == {
+        nested / "DSF7942.RAF",
+        nested / "DSF7942.THM",
+        src_dir / "DCIM" / "DSF0001.JPG",
+    }
+    assert file_stats[nested / "DSF7942.RAF"].st_size == len(b"raw data")
+
+    # Only the requested extensions are yielded, regardless of case
+    filtered = dict(myphotoscript.walk_files(src_dir, {".raf", ".jpg"}))
+    assert set(filtered) == {nested / "DSF7942.RAF", src_dir / "DCIM" / "DSF0001.JPG"}
+
+
+def test_walk_files_skips_unreadable_subdirectories(temp_directories):
+    """Test that an unreadable subdirectory doesn't abort the scan."""
+    src_dir, _ = temp_directories
+    (src_dir / "DSF0001.RAF").write_text("raw")
+    locked = src_dir / ".Trashes"
+    locked.mkdir()
+    (locked / "DSF0002.RAF").write_text("raw")
+
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.fspath(path) == os.fspath(locked):
+            raise PermissionError(13, "Permission denied", os.fspath(path))
+        return real_scandir(path)
+
+    with patch("myphotoscript.os.scandir", side_effect=scandir):
+        found = [path.name for path, _ in myphotoscript.walk_files(src_dir)]
+        # The root itself being unreadable is still an error
+        locked_walk = myphotoscript.walk_files(locked)
+        with pytest.raises(PermissionError):
+            next(locked_walk)
+
+    assert found == ["DSF0001.RAF"]
+
+
+def test_index_siblings_groups_related_files():
+    """Test that sidecars and edited versions are indexed under their base name."""
+    folder = Path("/sd/DCIM")
+    paths = [
+        folder / "IMG_1234.JPG",
+        folder / "IMG_1234.xmp",
+        folder / "IMG_1234-HDR.HEIC",
+        folder / "IMG_1234 edited.JPG",
+        folder / "IMG_1234(2).PNG",
+        folder / "IMG_12345.JPG",
+        folder / "IMG_1234(2.JPG",
+        Path("/sd/OTHER") / "IMG_1234.JPG",
+    ]
+
+    index = myphotoscript.index_siblings(paths)
+
+    assert index[folder]["img_1234"] == paths[:5]
+    assert index[Path("/sd/OTHER")]["img_1234"] == [paths[7]]
+
+
+def test_index_dir_scans_each_folder_once(temp_directories, mock_console):
+    """Test that files from the same folder share one cached directory scan."""
+    src_dir, dest_dir = temp_directories
+    for name in ["DSF0001.RAF", "DSF0001.XMP", "DSF0002.RAF", "DSF0002.XMP"]:
+        (src_dir / name).write_text(name)
+
+    myphotoscript._index_dir_listing.cache_clear()
+    with patch("myphotoscript.os.scandir", wraps=os.scandir) as mock_scandir:
+        for name in ["DSF0001.RAF", "DSF0002.RAF"]:
+            myphotoscript.move_file_and_sidecars(src_dir / name, dest_dir)
+
+    # The destination folder is listed on each call, the source only once
+    scanned = [c.args[0] for c in mock_scandir.call_args_list]
+    assert scanned.count(src_dir) == 1
+    assert sorted(p.name for p in dest_dir.iterdir()) == [
+        "DSF0001.RAF",
+        "DSF0001.XMP",
+        "DSF0002.RAF",
+        "DSF0002.XMP",
+    ]
+
+
+@pytest.mark.parametrize("kernel_copy", [True, False])
+def test_fast_copy_preserves_content_and_mtime(temp_directories, kernel_copy):
+    """Test that fast_copy behaves like shutil.copy2 with and without in-kernel copies."""
+    src_dir, dest_dir = temp_directories
+
+    src_file = src_dir / "DSF7942.RAF"
+    src_file.write_bytes(os.urandom(3 * 1024 * 1024 + 123))
+    os.utime(src_file, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+    src_file.chmod(0o640)
+
+    # Overwrite a longer existing file to make sure it gets truncated
+    dest_file = dest_dir / "DSF7942.RAF"
+    dest_file.write_bytes(b"x" * (4 * 1024 * 1024))
+
+    if kernel_copy:
+        myphotoscript.fast_copy(src_file, dest_file)
+    else:
+        with patch("myphotoscript._kernel_copy", return_value=False):
+            myphotoscript.fast_copy(src_file, dest_file)
+
+    assert dest_file.read_bytes() == src_file.read_bytes()
+    assert dest_file.stat().st_mtime_ns == src_file.stat().st_mtime_ns
+    assert dest_file.stat().st_mode & 0o777 == 0o640
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "copy_file_range") or not hasattr(os, "sendfile"),
+    reason="needs copy_file_range and sendfile",
+)
+def test_fast_copy_falls_back_to_sendfile(temp_directories):
+    """Test that sendfile is used when copy_file_range can't cross filesystems."""
+    src_dir, dest_dir = temp_directories
+
+    src_file = src_dir / "DSF7942.RAF"
+    src_file.write_bytes(os.urandom(1024 * 1024 + 7))
+    dest_file = dest_dir / "DSF7942.RAF"
+
+    with patch(
+        "myphotoscript.os.copy_file_range",
+        side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+    ), patch("myphotoscript.os.sendfile", wraps=os.sendfile) as mock_sendfile:
+        myphotoscript.fast_copy(src_file, dest_file)
+
+    assert mock_sendfile.called
+    assert dest_file.read_bytes() == src_file.read_bytes()
+
+
+def test_fast_copy_refuses_same_file(temp_directories):
+    """Test that copying a file onto itself fails without truncating it."""
+    src_dir, _ = temp_directories
+
+    src_file = src_dir / "DSF7942.RAF"
+    src_file.write_bytes(b"raw data")
+
+    with pytest.raises(shutil.SameFileError):
+        myphotoscript.fast_copy(src_file, src_file)
+
+    assert src_file.read_bytes() == b"raw data"
+
+
+def test_rsync_files_to_folder_sends_relative_file_list(temp_directories):
+    """Test that one rsync call gets every file relative to the source root."""
+    src_dir, dest_dir = temp_directories
+    src_files = [
+        src_dir / "100FUJI" / "DSF7942.RAF",
+        src_dir / "101FUJI" / "DSF0001.JPG",
+    ]
+    seen = {}
+
+    def fake_run(cmd, **kwargs):
+        list_arg = next(arg for arg in cmd if arg.startswith("--files-from="))
+        with open(list_arg.split("=", 1)[1]) as f:
+            seen["files"] = f.read().split("\0")
+        seen["cmd"] = cmd
+        return subprocess.CompletedProcess(cmd, 0, stdout="DSF7942.RAF\n", stderr="")
+
+    with patch("myphotoscript.subprocess.run", side_effect=fake_run) as mock_run:
+        transferred = myphotoscript.rsync_files_to_folder(src_dir, src_files, dest_dir)
+
+    assert mock_run.call_count == 1
+    assert seen["files"] == [
+        os.path.join("100FUJI", "DSF7942.RAF"),
+        os.path.join("101FUJI", "DSF0001.JPG"),
+    ]
+    assert seen["cmd"][-2:] == [f"{src_dir}/", f"{dest_dir}/"]
+    assert "--no-relative" in seen["cmd"]
+    assert transferred == {"DSF7942.RAF"}
+
+
+@pytest.mark.parametrize(
+    "metadata, expected",
+    [
+        ({"EXIF:DateTimeOriginal": "2025:03:22 10:11:12"}, ("2025", "03")),
+        ({"QuickTime:CreateDate": "2024-11-02T08:00:00Z"}, ("2024", "11")),
+        (
+            {
+                "EXIF:CreateDate": "2020:01:01 00:00:00",
+                "EXIF:DateTimeOriginal": "2019:12:31 23:59:59",
+            },
+            ("2019", "12"),
+        ),
+    ],
+)
+def test_parse_exif_date_formats(metadata, expected):
+    """Test that year and month are extracted from the supported date formats."""
+    assert myphotoscript._parse_exif_date(metadata) == expected
+
+
+def test_get_exif_dates_batches_files(mock_console):
+    """Test that capture dates are read in batches through a single exiftool process."""
+    paths = [Path(f"/sd/DSF{i:04d}.RAF") for i in range(5)]
+
+    def fake_get_tags(files, tags):
+        # Pretend exiftool could not read the last file
+        return [
+            {"SourceFile": name, "EXIF:DateTimeOriginal": "2024:07:15 10:11:12"}
+            for name in files
+            if not name.endswith("DSF0004.RAF")
+        ]
+
+    with patch("myphotoscript.exiftool.ExifToolHelper") as mock_helper:
+        et = mock_helper.return_value.__enter__.return_value
+        et.get_tags.side_effect = fake_get_tags
+        dates = myphotoscript.get_exif_dates(paths, batch_size=2)
+
+    # One exiftool process, one command per batch
+    assert mock_helper.call_count == 1
+    assert et.get_tags.call_count == 3
+
+    for path in paths[:4]:
+        assert dates[path] == ("2024", "07")
+
+    # Unreadable files fall back to the current date
+    assert paths[4] in dates
+    assert len(dates[paths[4]][0]) == 4
+
+
+def test_get_exif_dates_matches_differently_spelled_source_files(mock_console):
+    """Test that results are matched even if exiftool spells the path differently."""
+    paths = [Path("/sd/DCIM") / f"DSF{i:04d}.RAF" for i in range(3)]
+
+    def fake_get_tags(files, tags):
+        # e.g. forward slashes on Windows, or a non-normalized path
+        return [
+            {
+                "SourceFile": os.path.join(
+                    os.path.dirname(name), ".", os.path.basename(name)
+                ).replace(os.sep, "/"),
+                "EXIF:DateTimeOriginal": "2024:07:15 10:11:12",
+            }
+            for name in files
+        ]
+
+    with patch("myphotoscript.exiftool.ExifToolHelper") as mock_helper:
+        et = mock_helper.return_value.__enter__.return_value
+        et.get_tags.side_effect = fake_get_tags
+        dates = myphotoscript.get_exif_dates(paths)
+
+    assert dates == {path: ("2024", "07") for path in paths}
+
+
+def test_files_are_identical_compares_content(temp_directories):
+    """Test that files are compared by content, not just by name."""
+    src_dir, dest_dir = temp_directories
+
+    src_file = src_dir / "DSF7942.RAF"
+    src_file.write_bytes(b"raw data" * 1000)
+
+    same_file = dest_dir / "same.RAF"
+    same_file.write_bytes(b"raw data" * 1000)
+
+    # Same size, different content
+    changed_file = dest_dir / "changed.RAF"
+    changed_file.write_bytes(b"RAW DATA" * 1000)
+
+    # Give every file its own mtime so the content checks are exercised
+    for offset, path in enumerate([src_file, same_file, changed_file]):
+        os.utime(path, ns=(0, 1_600_000_000_000_000_000 + offset))
+
+    assert myphotoscript.files_are_identical(src_file, same_file) is True
+    assert myphotoscript.files_are_identical(src_file, changed_file) is False
+    assert myphotoscript.files_are_identical(src_file, dest_dir / "missing") is False
+
+
+def test_files_are_identical_skips_reads_for_matching_mtime(temp_directories):
+    """Test that files with the same size and mtime are trusted without reading them."""
+    src_dir, dest_dir = temp_directories
+
+    src_file = src_dir / "DSF7942.RAF"
+    src_file.write_bytes(b"raw data")
+    dest_file = dest_dir / "DSF7942.RAF"
+    shutil.copy2(src_file, dest_file)
+
+    with patch("myphotoscript.calculate_file_fingerprint") as mock_fingerprint:
+        assert myphotoscript.files_are_identical(src_file, dest_file) is True
+
+    mock_fingerprint.assert_not_called()
+
+
+def test_files_are_identical_accepts_hardlink_without_reading(temp_directories):
+    """Test that a hardlink to the source is identical without reading either file."""
+    src_dir, dest_dir = temp_directories
+
+    src_file = src_dir / "test.jpg"
+    src_file.write_bytes(b"photo" * 1000)
+    dest_file = dest_dir / "test.jpg"
+    os.link(src_file, dest_file)
+
+    with patch("myphotoscript.calculate_file_fingerprint") as mock_fingerprint:
+        assert myphotoscript.files_are_identical(src_file, dest_file)
+    mock_fingerprint.assert_not_called()
+
+
+def test_files_are_identical_rejects_size_mismatch_without_reading(
+    temp_directories,
+):
+    """Test that files of different sizes are told apart from their stats alone."""
+    src_dir, dest_dir = temp_directories
+
+    src_file = src_dir / "DSF7942.RAF"
+    src_file.write_bytes(b"x" * 1000)
+    dest_file = dest_dir / "DSF7942.RAF"
+    dest_file.write_bytes(b"x" * 999)
+
+    with patch("builtins.open") as mock_open:
+        assert myphotoscript.files_are_identical(src_file, dest_file) is False
+    mock_open.assert_not_called()
+
+
+def test_files_are_identical_detects_change_in_large_file(temp_directories):
+    """Test that a difference in the middle of a large file is still detected."""
+    src_dir, dest_dir = temp_directories
+
+    data = bytearray(os.urandom(1024 * 1024))
+    src_file = src_dir / "DSF7942.RAF"
+    src_file.write_bytes(data)
+
+    # Head and tail are unchanged, so only the full checksum can tell
+    data[len(data) // 2] ^= 0xFF
+    dest_file = dest_dir / "DSF7942.RAF"
+    dest_file.write_bytes(data)
+    os.utime(dest_file, ns=(0, 1_600_000_000_000_000_000))
+
+    assert myphotoscript.files_are_identical(src_file, dest_file) is False
+
+
+@pytest.mark.parametrize(
+    "size, flipped",
+    [
+        (0, None),
+        (10, None),
+        (3 * 1024 + 5, 0),
+        (3 * 1024 + 5, 2048),
+        (3 * 1024 + 5, -1),
+    ],
+)
+def test_compare_file_contents(temp_directories, size, flipped):
+    """Test the chunked comparison, including differences on chunk boundaries."""
+    src_dir, dest_dir = temp_directories
+
+    data = bytearray(os.urandom(size))
+    src_file = src_dir / "DSF7942.RAF"
+    src_file.write_bytes(data)
+    if flipped is not None:
+        data[flipped] ^= 0xFF
+    dest_file = dest_dir / "DSF7942.RAF"
+    dest_file.write_bytes(data)
+
+    assert myphotoscript.compare_file_contents(
+        src_file, dest_file, chunk_size=1024
+    ) is (flipped is None)
+
+
+def test_files_are_identical_with_process_pool(temp_directories):
+    """Test that the full comparison can run in a process pool."""
+    src_dir, dest_dir = temp_directories
+
+    data = os.urandom(1024 * 1024)
+    src_file = src_dir / "DSF7942.RAF"
+    src_file.write_bytes(data)
+    dest_file = dest_dir / "DSF7942.RAF"
+    dest_file.write_bytes(data)
+    os.utime(dest_file, ns=(0, 1_600_000_000_000_000_000))
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        assert (
+            myphotoscript.files_are_identical(
+                src_file, dest_file, compare_executor=executor
+            )
+            is True
+        )
+
+
+@pytest.mark.parametrize("algorithm", ["xxh3", "md5", "sha256"])
+def test_calculate_file_checksum_mmap_matches_read_loop(temp_directories, algorithm):
+    """Test that memory-mapped hashing gives the same checksum as the read loop."""
+    src_dir, _ = temp_directories
+
+    path = src_dir / "video.mov"
+    path.write_bytes(os.urandom(300 * 1024))
+
+    with patch("myphotoscript.MMAP_HASH_THRESHOLD", 1):
+        mapped = myphotoscript.calculate_file_checksum(path, algorithm)
+    read = myphotoscript.calculate_file_checksum(path, algorithm, buffer_size=4096)
+
+    assert mapped == read
+
+
+def test_queued_logging_prints_worker_messages():
+    """Test that messages logged from worker threads reach the console."""
+    from rich.console import Console
+
+    record_console = Console(record=True, width=80)
+    with patch("myphotoscript.console", record_console):
+        with myphotoscript.queued_logging():
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                for i in range(8):
+                    executor.submit(
+                        myphotoscript.logger.info, f"[blue]Processing[/] {i}"
+                    )
+
+    output = record_console.export_text()
+    for i in range(8):
+        assert f"Processing {i}" in output
+    assert "[blue]" not in output
+    assert not any(
+        isinstance(h, myphotoscript.logging.handlers.QueueHandler)
+        for h in myphotoscript.logger.handlers
+    )
+
+
 if __name__ == "__main__":
     pytest.main(["-v", "test_myphotoscript.py"])